@@ -1,13 +1,33 @@
 """Main CLI entry point for Anada."""
 
+import shutil
 import sys
+from functools import lru_cache
+
 import click
 from rich.console import Console
 
 from anada.config import Config
 from anada.note_manager import NoteManager
-from anada.renderer import MarkdownRenderer
-from anada.repl import REPL
+
+
+@lru_cache(maxsize=1)
+def _console() -> Console:
+    """Shared console for all subcommands."""
+    return Console()
+
+
+@lru_cache(maxsize=1)
+def _config() -> Config:
+    """Shared, once-loaded configuration."""
+    return Config()
+
+
+@lru_cache(maxsize=1)
+def _manager() -> NoteManager:
+    """Shared note manager for the configured notes directory."""
+    config = _config()
+    return NoteManager(config.notes_dir, cache_dir=config.config_dir)
 
 
 @click.group(invoke_without_command=True)
@@ -22,6 +42,7 @@ def cli(ctx, version):
     
     # If no subcommand, start REPL
     if ctx.invoked_subcommand is None:
+        from anada.repl import REPL
         repl = REPL()
         repl.run()
 
@@ -30,9 +51,8 @@ def cli(ctx, version):
 @click.argument('title')
 def new(title):
     """Create a new note."""
-    config = Config()
-    manager = NoteManager(config.notes_dir)
-    console = Console()
+    manager = _manager()
+    console = _console()
     
     try:
         path = manager.create(title)
@@ -47,9 +67,11 @@ def new(title):
 @click.argument('title')
 def show(title):
     """Show a note."""
-    config = Config()
-    manager = NoteManager(config.notes_dir)
-    console = Console()
+    from anada.renderer import MarkdownRenderer
+    
+    config = _config()
+    manager = _manager()
+    console = _console()
     renderer = MarkdownRenderer(config.get_theme_colors(), console)
     
     content = manager.read(title)
@@ -66,9 +88,8 @@ def show(title):
 @click.confirmation_option(prompt='Are you sure you want to delete this note?')
 def delete(title):
     """Delete a note."""
-    config = Config()
-    manager = NoteManager(config.notes_dir)
-    console = Console()
+    manager = _manager()
+    console = _console()
     
     if not manager.exists(title):
         console.print(f"[red]Note not found: {title}[/red]")
@@ -81,9 +102,11 @@ def delete(title):
 @cli.command()
 def list():
     """List all notes."""
-    config = Config()
-    manager = NoteManager(config.notes_dir)
-    console = Console()
+    from anada.renderer import MarkdownRenderer
+    
+    config = _config()
+    manager = _manager()
+    console = _console()
     renderer = MarkdownRenderer(config.get_theme_colors(), console)
     
     notes = manager.list_all()
@@ -94,9 +117,11 @@ def list():
 @click.argument('query')
 def search(query):
     """Search notes by content."""
-    config = Config()
-    manager = NoteManager(config.notes_dir)
-    console = Console()
+    from anada.renderer import MarkdownRenderer
+    
+    config = _config()
+    manager = _manager()
+    console = _console()
     renderer = MarkdownRenderer(config.get_theme_colors(), console)
     
     results = manager.search(query)
@@ -107,9 +132,8 @@ def search(query):
 @click.argument('title')
 def link(title):
     """Show links in a note."""
-    config = Config()
-    manager = NoteManager(config.notes_dir)
-    console = Console()
+    manager = _manager()
+    console = _console()
     
     content = manager.read(title)
     if content is None:
@@ -119,9 +143,8 @@ def link(title):
     links = manager.find_links(content)
     if links:
         console.print(f"\n[bold cyan]Links in '{title}':[/bold cyan]\n")
-        for link_title in links:
-            # Use print() to avoid Rich markup interpretation
-            print(f"  [[{link_title}]]")
+        # Use print() to avoid Rich markup interpretation; one write for all lines
+        print('\n'.join(f"  [[{link_title}]]" for link_title in links))
     else:
         console.print(f"[dim]No links found in '{title}'[/dim]")
 
@@ -130,16 +153,14 @@ def link(title):
 @click.argument('title')
 def backlinks(title):
     """Show backlinks to a note."""
-    config = Config()
-    manager = NoteManager(config.notes_dir)
-    console = Console()
+    manager = _manager()
+    console = _console()
     
     backlinks = manager.get_backlinks(title)
     if backlinks:
         console.print(f"\n[bold cyan]Backlinks to '{title}':[/bold cyan]\n")
-        for link in backlinks:
-            # Use print() to avoid Rich markup interpretation
-            print(f"  [[{link}]]")
+        # Use print() to avoid Rich markup interpretation; one write for all lines
+        print('\n'.join(f"  [[{link}]]" for link in backlinks))
     else:
         console.print(f"[dim]No backlinks found for '{title}'[/dim]")
 
@@ -148,8 +169,8 @@ def backlinks(title):
 @click.argument('theme_name')
 def theme(theme_name):
     """Change theme."""
-    config = Config()
-    console = Console()
+    config = _config()
+    console = _console()
     
     themes = config.get('themes', {})
     if theme_name in themes:
@@ -165,10 +186,8 @@ def theme(theme_name):
 @click.argument('editor_name', required=False)
 def editor(editor_name):
     """Show or set the editor."""
-    import shutil
-    
-    config = Config()
-    console = Console()
+    config = _config()
+    console = _console()
     
     if not editor_name:
         # Show current editor
@@ -202,14 +221,11 @@ def edit(title):
     """Edit a note in your default editor."""
     import subprocess
     
-    config = Config()
-    manager = NoteManager(config.notes_dir)
-    console = Console()
+    config = _config()
+    manager = _manager()
+    console = _console()
     
-    if not manager.exists(title):
-        manager.create(title)
-    
-    path = manager._get_note_path(title)
+    path, _ = manager.get_or_create_path(title)
     editor_cmd = config.editor
     
     # Show which editor is being used
@@ -220,11 +236,16 @@ def edit(title):
         console.print("[dim]Nano commands: Ctrl+O to save, Ctrl+X to exit[/dim]")
     
     try:
-        subprocess.run([editor_cmd, str(path)], check=True)
-        console.print(f"[green]Note saved to: {path}[/green]")
+        # CPython only uses posix_spawn() instead of fork()+exec() for an
+        # executable path with a directory part and close_fds=False
+        returncode = subprocess.call([shutil.which(editor_cmd) or editor_cmd, str(path)], close_fds=False)
     except Exception as e:
         console.print(f"[red]Failed to open editor: {e}[/red]")
         sys.exit(1)
+    if returncode != 0:
+        console.print(f"[red]Failed to open editor: {editor_cmd} exited with status {returncode}[/red]")
+        sys.exit(1)
+    console.print(f"[green]Note saved to: {path}[/green]")
 
 
 if __name__ == '__main__':
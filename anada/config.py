@@ -1,9 +1,22 @@
 """Configuration management for Anada."""
 
 import os
-import yaml
+import copy
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+# Parsed config files keyed by path, tagged with the (mtime, size) they were read at
+_CONFIG_CACHE: Dict[Path, Tuple[Tuple[float, int], Dict[str, Any]]] = {}
+
+
+def _yaml():
+    """Import yaml on first use, preferring libyaml's C loader/dumper."""
+    import yaml
+    try:
+        from yaml import CSafeLoader as Loader, CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeLoader as Loader, SafeDumper as Dumper
+    return yaml, Loader, Dumper
 
 
 class Config:
@@ -57,11 +70,23 @@ class Config:
     
     def load(self):
         """Load configuration from file."""
-        if self.config_file.exists():
+        try:
+            stat = self.config_file.stat()
+        except FileNotFoundError:
+            stat = None
+        
+        if stat is not None:
+            key = (stat.st_mtime, stat.st_size)
+            cached = _CONFIG_CACHE.get(self.config_file)
             try:
-                with open(self.config_file, 'r') as f:
-                    loaded = yaml.safe_load(f) or {}
-                    self._config.update(loaded)
+                if cached is not None and cached[0] == key:
+                    loaded = cached[1]
+                else:
+                    yaml, loader, _ = _yaml()
+                    with open(self.config_file, 'r') as f:
+                        loaded = yaml.load(f, Loader=loader) or {}
+                    _CONFIG_CACHE[self.config_file] = (key, loaded)
+                self._config.update(copy.deepcopy(loaded))
             except Exception as e:
                 print(f"Warning: Could not load config: {e}")
         
@@ -70,12 +95,16 @@ class Config:
             self.notes_dir = Path(self._config['notes_dir']).expanduser()
         if 'config_dir' in self._config:
             self.config_dir = Path(self._config['config_dir']).expanduser()
+        
+        self._theme_colors = self._resolve_theme_colors()
     
     def save(self):
         """Save current configuration to file."""
+        yaml, _, dumper = _yaml()
         self._ensure_directories()
         with open(self.config_file, 'w') as f:
-            yaml.dump(self._config, f, default_flow_style=False)
+            yaml.dump(self._config, f, Dumper=dumper, default_flow_style=False)
+        _CONFIG_CACHE.pop(self.config_file, None)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get a config value."""
@@ -84,6 +113,8 @@ class Config:
     def set(self, key: str, value: Any):
         """Set a config value."""
         self._config[key] = value
+        if key in ('theme', 'themes'):
+            self._theme_colors = self._resolve_theme_colors()
         self.save()
     
     @property
@@ -96,12 +127,16 @@ class Config:
         """Get current theme name."""
         return self._config.get('theme', 'default')
     
-    def get_theme_colors(self) -> Dict[str, str]:
-        """Get color scheme for current theme."""
+    def _resolve_theme_colors(self) -> Dict[str, str]:
+        """Look up the color scheme for the current theme."""
         theme_name = self.theme
         themes = self._config.get('themes', {})
         return themes.get(theme_name, themes.get('default', {}))
     
+    def get_theme_colors(self) -> Dict[str, str]:
+        """Get color scheme for current theme (resolved on load and on theme changes)."""
+        return self._theme_colors
+    
     @property
     def user_name(self) -> Optional[str]:
         """Get the configured user name."""
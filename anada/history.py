@@ -0,0 +1,103 @@
+"""Size-bounded command history for the REPL."""
+
+import os
+import tempfile
+import threading
+from typing import Iterable, List
+
+from prompt_toolkit.history import FileHistory
+
+
+class BoundedFileHistory(FileHistory):
+    """FileHistory that only loads and keeps the most recent entries.
+
+    Startup reads at most TAIL_BYTES from the end of the file, and once the
+    file grows past MAX_FILE_BYTES it is rewritten in a background thread
+    with only the last MAX_ENTRIES entries.
+    """
+
+    MAX_ENTRIES = 1000
+    TAIL_BYTES = 256 * 1024
+    MAX_FILE_BYTES = 512 * 1024
+
+    def __init__(self, filename: str):
+        super().__init__(filename)
+        self._lock = threading.Lock()
+        self._trimming = False
+
+    def _tail_entries(self) -> List[bytes]:
+        """Read the raw bytes of the last MAX_ENTRIES entries in the file."""
+        try:
+            with open(self.filename, 'rb') as f:
+                size = f.seek(0, os.SEEK_END)
+                start = max(0, size - self.TAIL_BYTES)
+                f.seek(start)
+                data = f.read()
+        except FileNotFoundError:
+            return []
+
+        if start > 0:
+            # Drop the partial entry we seeked into; entries start at a '#' header line
+            cut = data.find(b'\n#')
+            data = data[cut:] if cut >= 0 else b''
+
+        blocks = data.split(b'\n#')
+        entries = [b'\n#' + block for block in blocks[1:]]
+        if blocks[0].strip():
+            entries.insert(0, blocks[0])
+        return entries[-self.MAX_ENTRIES:]
+
+    def load_history_strings(self) -> Iterable[str]:
+        strings = []
+        lines = []
+
+        for entry in self._tail_entries():
+            for line_bytes in entry.splitlines(keepends=True):
+                line = line_bytes.decode('utf-8', errors='replace')
+                if line.startswith('+'):
+                    lines.append(line[1:])
+                elif lines:
+                    # Join and drop trailing newline.
+                    strings.append(''.join(lines)[:-1])
+                    lines = []
+        if lines:
+            strings.append(''.join(lines)[:-1])
+
+        # Newest items have to go first.
+        return reversed(strings)
+
+    def store_string(self, string: str):
+        with self._lock:
+            super().store_string(string)
+        self.trim_if_oversized()
+
+    def trim_if_oversized(self):
+        """Start a background trim if the file has grown past MAX_FILE_BYTES."""
+        with self._lock:
+            try:
+                oversized = os.path.getsize(self.filename) > self.MAX_FILE_BYTES
+            except OSError:
+                oversized = False
+            if not oversized or self._trimming:
+                return
+            self._trimming = True
+        threading.Thread(target=self._trim, daemon=True).start()
+
+    def _trim(self):
+        """Rewrite the history file with only the most recent entries."""
+        try:
+            with self._lock:
+                entries = self._tail_entries()
+                directory = os.path.dirname(os.path.abspath(self.filename))
+                fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.anada_history.')
+                try:
+                    with os.fdopen(fd, 'wb') as f:
+                        f.write(b''.join(entries))
+                    os.replace(tmp_path, self.filename)
+                except OSError:
+                    try:
+                        os.unlink(tmp_path)
+                    except OSError:
+                        pass
+        finally:
+            self._trimming = False
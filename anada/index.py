@@ -0,0 +1,147 @@
+"""Persistent inverted indexes over note files."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# orjson is optional; it serializes the index several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a derived cache to JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes written by `_dumps`."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(path: Path) -> Any:
+    """Read a JSON sidecar, returning None if it is missing or corrupt."""
+    try:
+        return _loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def write_json(path: Path, obj: Any):
+    """Write a JSON sidecar atomically; failures leave the old file in place."""
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=path.name + '.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_dumps(obj))
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+class InvertedIndex:
+    """Maps terms to the note files that contain them.
+
+    `extract` returns the terms of a note, such as its normalized [[link]]
+    targets. Entries are keyed by file name and stamped with the (mtime_ns,
+    size) the note had when it was indexed; `refresh` re-parses only notes
+    whose stamp changed, whether Anada or an external editor wrote them.
+    """
+
+    VERSION = 1
+
+    def __init__(self, index_file: Path, extract: Callable[[str], Iterable[str]]):
+        self.index_file = index_file
+        self.extract = extract
+        self._postings: Optional[Dict[str, Set[str]]] = None
+        self._notes: Dict[str, Tuple[Tuple[int, int], List[str]]] = {}
+
+    def _ensure_loaded(self):
+        """Load the index from disk on first use."""
+        if self._postings is not None:
+            return
+        self._postings = {}
+        self._notes = {}
+        data = read_json(self.index_file)
+        if not isinstance(data, dict) or data.get('version') != self.VERSION:
+            return
+        # Saved term lists are already sorted and unique, so load them as-is
+        postings = self._postings
+        for name, (stamp, terms) in data.get('notes', {}).items():
+            self._notes[name] = (tuple(stamp), terms)
+            for term in terms:
+                names = postings.get(term)
+                if names is None:
+                    postings[term] = {name}
+                else:
+                    names.add(name)
+
+    def _add(self, name: str, stamp: Tuple[int, int], terms: Iterable[str]):
+        """Record the terms of one note in the postings."""
+        terms = sorted(set(terms))
+        self._notes[name] = (stamp, terms)
+        for term in terms:
+            self._postings.setdefault(term, set()).add(name)
+
+    def _discard(self, name: str) -> bool:
+        """Drop one note from the postings."""
+        entry = self._notes.pop(name, None)
+        if entry is None:
+            return False
+        for term in entry[1]:
+            names = self._postings.get(term)
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del self._postings[term]
+        return True
+
+    def save(self):
+        """Write the index to disk atomically."""
+        if self._postings is None:
+            return
+        data = {
+            'version': self.VERSION,
+            'notes': {name: [list(stamp), terms] for name, (stamp, terms) in self._notes.items()},
+        }
+        write_json(self.index_file, data)
+
+    def refresh(self, notes: Iterable[Tuple[Path, os.DirEntry]]):
+        """Re-index notes whose stat no longer matches and drop vanished ones."""
+        self._ensure_loaded()
+        changed = False
+        seen = set()
+        for path, entry in notes:
+            seen.add(path.name)
+            stat = entry.stat()
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            indexed = self._notes.get(path.name)
+            if indexed is not None and indexed[0] == stamp:
+                continue
+            try:
+                content = path.read_text(encoding='utf-8', errors='replace')
+            except OSError:
+                continue
+            self._discard(path.name)
+            self._add(path.name, stamp, self.extract(content))
+            changed = True
+        for name in [name for name in self._notes if name not in seen]:
+            self._discard(name)
+            changed = True
+        if changed:
+            self.save()
+
+    def names(self, term: str) -> Set[str]:
+        """Return the names of notes indexed under exactly `term`."""
+        self._ensure_loaded()
+        return set(self._postings.get(term, ()))
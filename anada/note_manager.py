@@ -1,25 +1,49 @@
 """Note management operations (CRUD)."""
 
 import os
-import re
+import heapq
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterable, Optional, Iterator, Tuple
 from datetime import datetime
 
+from anada.index import InvertedIndex, read_json, write_json
+
 
 class NoteManager:
     """Manages note files and operations."""
     
-    LINK_PATTERN = re.compile(r'\[\[([^\]]+)\]\]')
     
-    def __init__(self, notes_dir: Path):
+    FRONTMATTER_TEMPLATE = '---\ncreated: {created}\n---\n\n# {title}\n\n'
+    
+    # Title -> filename normalization in a single pass: ASCII lowercase, ' ' and '/' to '_'
+    _PATH_TRANS = str.maketrans({
+        ' ': '_',
+        '/': '_',
+        **{chr(c): chr(c + 32) for c in range(ord('A'), ord('Z') + 1)},
+    })
+    
+    # Searches over at least this many candidate notes are spread across a thread pool
+    PARALLEL_SEARCH_MIN = 32
+    SEARCH_WORKERS = min(8, os.cpu_count() or 1)
+    
+    def __init__(self, notes_dir: Path, cache_dir: Path):
         self.notes_dir = notes_dir
         self.notes_dir.mkdir(parents=True, exist_ok=True)
+        # Derived caches live in the config dir, not the vault: writing them into
+        # notes_dir would clutter it and bump the directory mtime that the
+        # titles cache is keyed on
+        self.cache_dir = cache_dir
+        self.titles_cache_file = self.cache_dir / '.titles_cache.json'
+        # Reverse link index: normalized [[link]] target -> notes that link to it
+        self._backlinks = InvertedIndex(self.cache_dir / '.backlinks.json', extract=self._extract_links)
     
     def _get_note_path(self, title: str) -> Path:
         """Convert title to file path."""
         # Normalize title: lowercase, replace spaces with underscores
-        filename = title.lower().replace(' ', '_').replace('/', '_')
+        if not title.isascii():
+            title = title.lower()
+        filename = title.translate(self._PATH_TRANS)
         if not filename.endswith('.md'):
             filename += '.md'
         return self.notes_dir / filename
@@ -32,23 +56,32 @@ class NoteManager:
     def create(self, title: str) -> Path:
         """Create a new note."""
         note_path = self._get_note_path(title)
-        if note_path.exists():
-            raise FileExistsError(f"Note '{title}' already exists")
-        
-        # Create note with basic frontmatter
-        frontmatter = f"""---
-created: {datetime.now().isoformat()}
----
-
-# {title}
-
-"""
-        # Write to disk and ensure it's flushed
-        note_path.write_text(frontmatter, encoding='utf-8')
-        # Ensure file is synced to disk
-        note_path.resolve().stat()  # Force filesystem sync
+        try:
+            self._create_at(note_path, title)
+        except FileExistsError:
+            raise FileExistsError(f"Note '{title}' already exists") from None
         return note_path
     
+    def get_or_create_path(self, title: str) -> Tuple[Path, bool]:
+        """Return the note's path and whether it already existed, creating it if not."""
+        note_path = self._get_note_path(title)
+        try:
+            self._create_at(note_path, title)
+        except FileExistsError:
+            return note_path, True
+        return note_path, False
+    
+    def _create_at(self, note_path: Path, title: str):
+        """Write a new note at note_path, raising FileExistsError if it is taken."""
+        # Create note with basic frontmatter
+        frontmatter = self.FRONTMATTER_TEMPLATE.format(
+            created=datetime.now().isoformat(),
+            title=title,
+        )
+        # Exclusive create does the existence check and the write in one open()
+        with open(note_path, 'xb') as f:
+            f.write(frontmatter.encode('utf-8'))
+    
     def read(self, title: str) -> Optional[str]:
         """Read note content."""
         note_path = self._get_note_path(title)
@@ -60,8 +93,6 @@ created: {datetime.now().isoformat()}
         """Update note content and save to disk."""
         note_path = self._get_note_path(title)
         note_path.write_text(content, encoding='utf-8')
-        # Ensure file is synced to disk
-        note_path.resolve().stat()  # Force filesystem sync
     
     def delete(self, title: str) -> bool:
         """Delete a note."""
@@ -75,63 +106,178 @@ created: {datetime.now().isoformat()}
         """Check if note exists."""
         return self._get_note_path(title).exists()
     
+    def _note_info(self, path: Path, stat: os.stat_result) -> Dict[str, any]:
+        """Build the metadata dict for one note."""
+        return {
+            'title': self._get_title_from_path(path),
+            'path': path,
+            'created': datetime.fromtimestamp(stat.st_ctime),
+            'modified': datetime.fromtimestamp(stat.st_mtime),
+            'size': stat.st_size,
+        }
+    
+    def iter_notes(self) -> Iterator[Dict[str, any]]:
+        """Yield metadata for every note in directory order, without sorting."""
+        # DirEntry caches its stat, so each note costs one syscall beyond getdents
+        for path, entry in self._iter_notes():
+            yield self._note_info(path, entry.stat())
+    
+    def status(self, k: int) -> Tuple[int, List[Dict[str, any]]]:
+        """Return the note count and the `k` most recently modified notes, newest first.
+        
+        One scandir pass feeds both; a heap picks the recent notes instead of
+        building and sorting metadata for every note.
+        """
+        notes = list(self._iter_notes())
+        recent = heapq.nlargest(k, notes, key=lambda note: note[1].stat().st_mtime)
+        return len(notes), [self._note_info(path, entry.stat()) for path, entry in recent]
+    
     def list_all(self) -> List[Dict[str, any]]:
-        """List all notes with metadata."""
-        notes = []
-        for path in self.notes_dir.glob('*.md'):
-            stat = path.stat()
-            notes.append({
-                'title': self._get_title_from_path(path),
-                'path': path,
-                'created': datetime.fromtimestamp(stat.st_ctime),
-                'modified': datetime.fromtimestamp(stat.st_mtime),
-                'size': stat.st_size,
+        """List all notes with metadata, most recently modified first."""
+        return sorted(self.iter_notes(), key=lambda x: x['modified'], reverse=True)
+    
+    def list_titles_cached(self) -> Dict[str, str]:
+        """Map each note's file name to its title, reusing the on-disk cache while notes_dir is unchanged.
+
+        Creating, deleting or renaming a note changes the directory mtime,
+        so a matching mtime means the cached file names are still current.
+        """
+        mtime_ns = os.stat(self.notes_dir).st_mtime_ns
+        cached = read_json(self.titles_cache_file)
+        if (isinstance(cached, dict) and cached.get('mtime_ns') == mtime_ns
+                and cached.get('notes_dir') == str(self.notes_dir)
+                and isinstance(cached.get('names'), list)):
+            names = cached['names']
+        else:
+            names = sorted(entry.name for _, entry in self._iter_notes())
+            write_json(self.titles_cache_file, {
+                'notes_dir': str(self.notes_dir),
+                'mtime_ns': mtime_ns,
+                'names': names,
             })
-        return sorted(notes, key=lambda x: x['modified'], reverse=True)
+        # Same as _get_title_from_path, without building a Path per note
+        return {name: name[:-3].replace('_', ' ') for name in names}
+    
+    @staticmethod
+    def _find_links_fast(content: str) -> List[str]:
+        """Extract [[link]] targets with str.find: non-empty text without ']' between '[[' and ']]'."""
+        links = []
+        find = content.find
+        i = 0
+        while True:
+            start = find('[[', i)
+            if start < 0:
+                break
+            close = find(']', start + 2)
+            if close < 0:
+                break
+            if close > start + 2 and content.startswith(']]', close):
+                links.append(content[start + 2:close])
+                i = close + 2
+            else:
+                # Empty link or a lone ']' inside it: retry from the next '['
+                i = start + 1
+        return links
     
     def find_links(self, content: str) -> List[str]:
         """Extract all [[link]] references from content."""
-        return self.LINK_PATTERN.findall(content)
+        return self._find_links_fast(content)
+    
+    def _iter_notes(self) -> Iterator[Tuple[Path, os.DirEntry]]:
+        """Yield (path, entry) for every note file in a single directory pass."""
+        with os.scandir(self.notes_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.md') and entry.is_file():
+                    yield Path(entry.path), entry
+    
+    @staticmethod
+    def _normalize_link(link: str) -> str:
+        """Normalize a link or title for comparison (lowercase, underscores, no .md)."""
+        normalized = link.lower().replace(' ', '_')
+        if normalized.endswith('.md'):
+            normalized = normalized[:-3]
+        return normalized
+    
+    def _extract_links(self, content: str) -> List[str]:
+        """Return the normalized link targets of a note, for the reverse link index."""
+        return [self._normalize_link(link) for link in self.find_links(content)]
     
     def get_backlinks(self, title: str) -> List[str]:
         """Find all notes that link to the given note."""
-        backlinks = []
-        target_normalized = title.lower().replace(' ', '_')
+        # Re-parse only notes whose stat changed since the last query, then answer from the reverse index
+        self._backlinks.refresh(self._iter_notes())
+        sources = self._backlinks.names(self._normalize_link(title))
+        return sorted(self._get_title_from_path(Path(name)) for name in sources)
+    
+    def _scan_file(self, path: Path, query_lower: str, query_bytes: Optional[bytes]) -> Optional[Dict[str, any]]:
+        """Search one note file, returning its result entry or None on a miss."""
+        try:
+            with open(path, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            # Deleted since it was listed
+            return None
         
-        for note in self.list_all():
-            content = self.read(note['title'])
-            if content:
-                links = self.find_links(content)
-                # Check if any link matches (normalize for comparison)
-                for link in links:
-                    link_normalized = link.lower().replace(' ', '_')
-                    if link_normalized == target_normalized or link_normalized == target_normalized.replace('.md', ''):
-                        backlinks.append(note['title'])
-                        break
+        # ASCII fast path: bytes.lower() agrees with str.lower() here, so
+        # misses are rejected without decoding the file at all
+        if query_bytes is not None and raw.isascii():
+            raw_lower = raw.lower()
+            idx = raw_lower.find(query_bytes)
+            if idx == -1:
+                return None
+            matches = raw_lower.count(query_bytes)
+            content = raw.decode('ascii')
+        else:
+            content = raw.decode('utf-8', 'replace')
+            content_lower = content.lower()
+            idx = content_lower.find(query_lower)
+            if idx == -1:
+                return None
+            matches = content_lower.count(query_lower)
         
-        return backlinks
+        return {
+            'title': self._get_title_from_path(path),
+            'path': path,
+            'snippet': self._get_snippet(content, query_lower, idx=idx),
+            'matches': matches,
+        }
     
-    def search(self, query: str) -> List[Dict[str, any]]:
-        """Search notes by content."""
-        results = []
+    def search(self, query: str, paths: Optional[Iterable[Path]] = None) -> List[Dict[str, any]]:
+        """Search notes by content.
+        
+        If `paths` is given, only those note files are scanned, e.g. the hits
+        of an earlier query that the new query extends.
+        """
         query_lower = query.lower()
+        query_bytes = query_lower.encode('ascii') if query_lower.isascii() else None
+        
+        if paths is not None:
+            jobs = list(paths)
+        else:
+            jobs = [path for path, _ in self._iter_notes()]
         
-        for note in self.list_all():
-            content = self.read(note['title'])
-            if content and query_lower in content.lower():
-                results.append({
-                    'title': note['title'],
-                    'snippet': self._get_snippet(content, query),
-                    'matches': content.lower().count(query_lower),
-                })
+        def scan(path):
+            return self._scan_file(path, query_lower, query_bytes)
+        
+        # Reads and bytes scans release the GIL, so threads overlap I/O across notes.
+        # map() keeps directory order, which keeps ties in the final sort stable.
+        if len(jobs) >= self.PARALLEL_SEARCH_MIN and self.SEARCH_WORKERS > 1:
+            with ThreadPoolExecutor(max_workers=self.SEARCH_WORKERS) as pool:
+                scanned = list(pool.map(scan, jobs))
+        else:
+            scanned = [scan(job) for job in jobs]
+        results = [result for result in scanned if result is not None]
         
         return sorted(results, key=lambda x: x['matches'], reverse=True)
     
-    def _get_snippet(self, content: str, query: str, context: int = 50) -> str:
-        """Get a snippet around the first match."""
-        query_lower = query.lower()
-        content_lower = content.lower()
-        idx = content_lower.find(query_lower)
+    def _get_snippet(self, content: str, query: str, context: int = 50, idx: Optional[int] = None) -> str:
+        """Get a snippet around the first match.
+        
+        Callers that already located the match pass its `idx` so the content
+        is not lowercased and searched a second time.
+        """
+        if idx is None:
+            idx = content.lower().find(query.lower())
         
         if idx == -1:
             return content[:context * 2]
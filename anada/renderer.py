@@ -5,37 +5,69 @@ from typing import Dict
 from rich.console import Console
 from rich.markdown import Markdown
 from rich.panel import Panel
+from rich.table import Table
 from rich.text import Text
+from rich import box
 
 
 class MarkdownRenderer:
     """Renders Markdown with theme colors."""
     
-    # Patterns for Markdown elements
-    HEADER_PATTERN = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
-    BOLD_PATTERN = re.compile(r'\*\*([^*]+)\*\*')
-    ITALIC_PATTERN = re.compile(r'\*([^*]+)\*')
-    CODE_PATTERN = re.compile(r'`([^`]+)`')
-    LINK_PATTERN = re.compile(r'\[\[([^\]]+)\]\]')
-    BLOCKQUOTE_PATTERN = re.compile(r'^>\s+(.+)$', re.MULTILINE)
+    # Single alternation over all Markdown elements; group names match theme keys
+    TOKEN_PATTERN = re.compile(
+        r'(?P<header>^#{1,6}\s+.+$)'
+        r'|(?P<bold>\*\*[^*]+\*\*)'
+        r'|(?P<italic>\*[^*]+\*)'
+        r'|(?P<code>`[^`]+`)'
+        r'|(?P<link>\[\[[^\]]+\]\])'
+        r'|(?P<blockquote>^>\s+.+$)',
+        re.MULTILINE
+    )
+    
+    # Extra emphasis layered on top of the theme color for each element
+    TOKEN_EMPHASIS = {
+        'header': 'bold ',
+        'bold': 'bold ',
+        'italic': 'italic ',
+    }
+    
+    DEFAULT_COLORS = {
+        'header': 'cyan',
+        'bold': 'bright_white',
+        'link': 'blue',
+        'code': 'yellow',
+        'italic': 'white',
+        'blockquote': 'dim white',
+    }
     
     def __init__(self, theme_colors: Dict[str, str], console: Console):
         self.theme_colors = theme_colors
         self.console = console
+        # Resolved style per token kind for the current theme
+        self._style_cache: Dict[str, str] = {}
+    
+    def set_theme(self, theme_colors: Dict[str, str]):
+        """Switch to another theme's colors, keeping this renderer and its caches."""
+        self.theme_colors = theme_colors
+        self._style_cache.clear()
+    
+    def _style_for(self, kind: str) -> str:
+        """Get the style for a token kind under the current theme."""
+        style = self._style_cache.get(kind)
+        if style is None:
+            color = self.theme_colors.get(kind, self.DEFAULT_COLORS[kind])
+            style = self.TOKEN_EMPHASIS.get(kind, '') + color
+            self._style_cache[kind] = style
+        return style
     
     def render(self, content: str) -> Text:
         """Render Markdown content with theme colors."""
         text = Text(content)
         
-        # Apply colors based on theme
-        # This is a simplified renderer - rich.Markdown is better but harder to theme
-        
-        # Headers
-        for match in self.HEADER_PATTERN.finditer(content):
-            level = len(match.group(1))
-            header_text = match.group(2)
-            color = self.theme_colors.get('header', 'cyan')
-            # Rich will handle this better, but we'll use console.print with Markdown
+        # This is a simplified renderer - rich.Markdown is better but harder to theme.
+        # One finditer pass styles every element instead of a scan per pattern.
+        for match in self.TOKEN_PATTERN.finditer(content):
+            text.stylize(self._style_for(match.lastgroup), match.start(), match.end())
         
         return text
     
@@ -62,9 +94,6 @@ class MarkdownRenderer:
             self.console.print(empty_panel)
             return
         
-        from rich.table import Table
-        from rich import box
-        
         table = Table(box=box.ROUNDED, show_header=True, header_style="bold cyan", title=f"Notes ({len(notes)} total)")
         table.add_column("Title", style="cyan", width=30)
         table.add_column("Modified", style="dim", width=20)
@@ -98,9 +127,6 @@ class MarkdownRenderer:
             self.console.print(no_results_panel)
             return
         
-        from rich.table import Table
-        from rich import box
-        
         table = Table(box=box.ROUNDED, show_header=True, header_style="bold cyan", 
                      title=f"Search Results for '{query}' ({len(results)} found)")
         table.add_column("Note", style="cyan", width=25)
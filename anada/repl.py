@@ -1,37 +1,186 @@
 """Interactive REPL command mode."""
 
-import os
+import re
+import shutil
 import subprocess
-from typing import List, Optional
+import sys
+from bisect import bisect_left
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
 from prompt_toolkit import PromptSession
-from prompt_toolkit.completion import WordCompleter
-from prompt_toolkit.history import FileHistory
-from prompt_toolkit.shortcuts import radiolist_dialog, input_dialog
-from prompt_toolkit.formatted_text import HTML
+from prompt_toolkit.completion import Completer, Completion
+from prompt_toolkit.history import ThreadedHistory
 from rich.console import Console
 from rich.panel import Panel
-from rich.live import Live
-from rich.layout import Layout
 from rich.table import Table
+from rich.text import Text
 from rich import box
 
 from anada.config import Config
+from anada.history import BoundedFileHistory
 from anada.note_manager import NoteManager
 from anada.renderer import MarkdownRenderer
 
 
+# Static welcome text; the greeting and notes directory are filled in once at startup
+_WELCOME_BODY = (
+    "[bold cyan]Anada[/bold cyan] - Terminal-based Obsidian-like notes\n"
+    "{greeting}\n"
+    "Notes directory: [dim]{notes_path}[/dim]\n"
+    "All notes are [green]persistent[/green] across sessions!\n\n"
+    "[bold yellow]Interactive Features:[/bold yellow]\n"
+    "• [green]menu[/green] - Interactive command menu\n"
+    "• [green]live-search[/green] - Real-time search with preview\n"
+    "• [green]status[/green] - Live dashboard\n\n"
+    "Type [dim]help[/dim] for all commands or [dim]quit[/dim] to exit."
+)
+
+# Static help text; only the notes directory is filled in, once per session
+_HELP_BODY = """
+[bold cyan]Commands:[/bold cyan]
+
+  [cyan]new <title>[/cyan]          Create a new note
+  [cyan]edit <title>[/cyan]         Open note in editor
+  [cyan]open <title>[/cyan]         Alias for edit
+  [cyan]show <title>[/cyan]         Display note content
+  [cyan]delete <title>[/cyan]       Delete a note
+  [cyan]list[/cyan]                 List all notes
+  [cyan]search <query>[/cyan]       Search notes by content
+  [cyan]link <title>[/cyan]         Show links in a note
+  [cyan]backlinks <title>[/cyan]    Show backlinks to a note
+  [cyan]theme <name>[/cyan]         Change theme (default, dark, nord, cyan, brown, grey)
+  [cyan]editor [name][/cyan]        Show or set editor (nano, vim, etc.)
+  [cyan]user [name][/cyan]          Show or set user name
+  [cyan]clear[/cyan]                Clear screen
+  [cyan]help[/cyan]                 Show this help
+  [cyan]quit[/cyan]                 Exit Anada
+
+[bold green]Interactive Features:[/bold green]
+
+  [green]menu[/green]                   Interactive command menu
+  [green]live-search[/green]            Real-time search with preview
+  [green]status[/green]                Show live statistics
+  [green]interactive[/green]           Toggle interactive mode
+
+[dim]Tip: Type a note title directly to view it[/dim]
+
+[dim]Notes are saved to: {notes_path}[/dim]
+[dim]All notes persist across terminal sessions![/dim]
+"""
+
+
+@lru_cache(maxsize=32)
+def _which_cached(name: str) -> Optional[str]:
+    """shutil.which, memoized; PATH is treated as fixed for the session."""
+    return shutil.which(name)
+
+
+class AnadaCompleter(Completer):
+    """Case-insensitive prefix completer over a sorted word list.
+    
+    Each keystroke bisects to the first word with the typed prefix and yields
+    forward from there, so lookup cost does not grow with the number of notes.
+    The list is only sorted on the first completion after `set_words`.
+    """
+    
+    def __init__(self, words: Iterable[str] = (), max_results: int = 20):
+        self.max_results = max_results
+        self.set_words(words)
+    
+    def set_words(self, words: Iterable[str]):
+        """Replace the word list; sorting is deferred until it is needed."""
+        self._pending: Optional[List[str]] = list(words)
+        self._keys: List[str] = []
+        self._words: List[str] = []
+    
+    def _ensure_sorted(self):
+        """Sort pending words by their lowercase form."""
+        if self._pending is None:
+            return
+        pairs = sorted((word.lower(), word) for word in self._pending)
+        self._keys = [key for key, _ in pairs]
+        self._words = [word for _, word in pairs]
+        self._pending = None
+    
+    def get_completions(self, document, complete_event):
+        self._ensure_sorted()
+        prefix = document.get_word_before_cursor()
+        key = prefix.lower()
+        keys = self._keys
+        i = bisect_left(keys, key)
+        end = min(len(keys), i + self.max_results)
+        while i < end and keys[i].startswith(key):
+            yield Completion(self._words[i], start_position=-len(prefix))
+            i += 1
+
+
 class REPL:
     """Interactive REPL for Anada."""
     
+    SEARCH_CACHE_SIZE = 32
+    
+    # Above this many notes, completions are shown on Tab instead of while typing
+    EAGER_COMPLETION_MAX = 500
+    
+    COMMANDS = ['new', 'edit', 'open', 'show', 'delete', 'list', 'search',
+                'link', 'backlinks', 'theme', 'editor', 'help', 'quit', 'exit', 'clear',
+                'menu', 'live-search', 'status', 'interactive', 'user']
+    
     def __init__(self):
         self.config = Config()
         self.console = Console()
-        self.note_manager = NoteManager(self.config.notes_dir)
+        self.note_manager = NoteManager(self.config.notes_dir, cache_dir=self.config.config_dir)
         self.renderer = MarkdownRenderer(
             self.config.get_theme_colors(),
             self.console
         )
+        # Only changed through _cmd_editor, which keeps this in step with the config
+        self._editor = self.config.editor
+        # Themes only change by editing config.yml, which is read once at startup
+        self._theme_names = frozenset(self.config.get('themes', {}))
+        # Help markup is parsed once per session rather than on every 'help'
+        self._help_renderable = self.console.render_str(
+            _HELP_BODY.format(notes_path=self.config.notes_dir)
+        )
         self.session = None
+        self._yes_no_session = None
+        self._completer = AnadaCompleter()
+        self._complete_while_typing = True
+        # File name -> title of every note, kept in step by _cmd_new/_cmd_edit/
+        # _cmd_delete, so bare-title dispatch is a dict lookup instead of a stat.
+        # Reloaded from disk only when the notes directory mtime moves on from
+        # _note_files_mtime, e.g. after notes were created outside the REPL.
+        self._note_files: Dict[str, str] = {}
+        self._note_files_mtime: Optional[int] = None
+        # Recent live-search results, keyed by lowercased query, oldest first
+        self._search_cache: 'OrderedDict[str, list]' = OrderedDict()
+        # Command name -> bound handler, split by arity so dispatch is one dict lookup
+        self._nullary = {
+            'help': self._cmd_help,
+            'list': self._cmd_list,
+            'quit': self._cmd_quit,
+            'exit': self._cmd_quit,
+            'clear': self._cmd_clear,
+            'menu': self._cmd_interactive_menu,
+            'live-search': self._cmd_live_search,
+            'status': self._cmd_show_status,
+            'interactive': self._cmd_toggle_interactive,
+        }
+        self._unary = {
+            'new': self._cmd_new,
+            'edit': self._cmd_edit,
+            'open': self._cmd_edit,
+            'show': self._cmd_show,
+            'delete': self._cmd_delete,
+            'search': self._cmd_search,
+            'link': self._cmd_link,
+            'backlinks': self._cmd_backlinks,
+            'theme': self._cmd_theme,
+            'editor': self._cmd_editor,
+            'user': self._cmd_user,
+        }
         self.running = True
         self.interactive_mode = False
         self.status_info = {
@@ -44,48 +193,71 @@ class REPL:
         """Setup prompt session with history and autocompletion."""
         history_file = self.config.config_dir / '.anada_history'
         
-        # Get note titles for autocompletion
-        notes = self.note_manager.list_all()
-        note_titles = [note['title'] for note in notes]
+        self._load_note_files()
         
-        commands = ['new', 'edit', 'open', 'show', 'delete', 'list', 'search', 
-                   'link', 'backlinks', 'theme', 'editor', 'help', 'quit', 'exit', 'clear',
-                   'menu', 'live-search', 'status', 'interactive', 'user']
-        completer = WordCompleter(commands + note_titles, ignore_case=True)
+        history = BoundedFileHistory(str(history_file))
+        # Cap a history file left oversized by earlier versions or other sessions
+        history.trim_if_oversized()
         
+        # History is read in a background thread so the first prompt is not held up by the file
         self.session = PromptSession(
-            history=FileHistory(str(history_file)),
-            completer=completer,
-            complete_while_typing=True,
+            history=ThreadedHistory(history),
+            completer=self._completer,
+            complete_while_typing=self._complete_while_typing,
         )
-        
-        # Update status info
-        self._update_status_info()
+        # Bare session for y/N confirmations: no completer or history to update per keystroke
+        self._yes_no_session = PromptSession()
+    
+    def _load_note_files(self) -> bool:
+        """Reload the note set if the notes directory changed since the last load."""
+        try:
+            mtime_ns = self.config.notes_dir.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns is not None and mtime_ns == self._note_files_mtime:
+            return False
+        # Real file names from the directory listing, so membership agrees with exists()
+        self._note_files = self.note_manager.list_titles_cached()
+        self._note_files_mtime = mtime_ns
+        self._sync_completer()
+        return True
+    
+    def _note_added(self, path: Path):
+        """Record a note this session created."""
+        if path.name not in self._note_files:
+            self._note_files[path.name] = path.stem.replace('_', ' ')
+            self._sync_completer()
+    
+    def _note_removed(self, path: Path):
+        """Forget a note this session deleted."""
+        if self._note_files.pop(path.name, None) is not None:
+            self._sync_completer()
+    
+    def _sync_completer(self):
+        """Point the completer at the current note titles."""
+        titles = list(self._note_files.values())
+        self._completer.set_words(self.COMMANDS + titles)
+        # Large vaults complete on Tab only, so typing never waits on the completion menu
+        self._complete_while_typing = len(titles) < self.EAGER_COMPLETION_MAX
+        if self.session is not None:
+            self.session.complete_while_typing = self._complete_while_typing
     
     def run(self):
         """Start the REPL."""
+        if not sys.stdin.isatty():
+            # Piped script: no prompt session, history file or welcome banner
+            self._run_batch()
+            return
+        
         self._setup_session()
         
         # Get or prompt for user name
         user_name = self.config.prompt_for_user_name()
         
         # Welcome message
-        notes_path = self.config.notes_dir
-        if user_name:
-            greeting = f"Welcome back, {user_name}!"
-        else:
-            greeting = "Welcome to Anada!"
-            
+        greeting = f"Welcome back, {user_name}!" if user_name else "Welcome to Anada!"
         welcome = Panel.fit(
-            f"[bold cyan]Anada[/bold cyan] - Terminal-based Obsidian-like notes\n"
-            f"{greeting}\n"
-            f"Notes directory: [dim]{notes_path}[/dim]\n"
-            f"All notes are [green]persistent[/green] across sessions!\n\n"
-            f"[bold yellow]Interactive Features:[/bold yellow]\n"
-            f"• [green]menu[/green] - Interactive command menu\n"
-            f"• [green]live-search[/green] - Real-time search with preview\n"
-            f"• [green]status[/green] - Live dashboard\n\n"
-            f"Type [dim]help[/dim] for all commands or [dim]quit[/dim] to exit.",
+            _WELCOME_BODY.format(greeting=greeting, notes_path=self.config.notes_dir),
             border_style="cyan"
         )
         self.console.print(welcome)
@@ -106,91 +278,63 @@ class REPL:
             except Exception as e:
                 self.console.print(f"[red]Error: {e}[/red]")
     
+    def _run_batch(self):
+        """Run commands read from non-interactive stdin, one per line."""
+        for line in sys.stdin:
+            command = line.strip()
+            if not command:
+                continue
+            try:
+                self._process_command(command)
+            except EOFError:
+                # A confirmation or live-search prompt ran past the end of the script
+                break
+            except Exception as e:
+                self.console.print(f"[red]Error: {e}[/red]")
+            if not self.running:
+                break
+    
+    def _prompt(self, message: str) -> str:
+        """Read a line from the prompt session, or from stdin in batch mode."""
+        if self.session is None:
+            return input(message)
+        return self.session.prompt(message)
+    
     def _process_command(self, command: str):
         """Process a command."""
-        parts = command.split(None, 1)
-        cmd = parts[0].lower()
-        args = parts[1] if len(parts) > 1 else ""
-        
-        if cmd == 'help':
-            self._cmd_help()
-        elif cmd == 'quit' or cmd == 'exit':
-            self.running = False
-        elif cmd == 'clear':
-            os.system('clear' if os.name != 'nt' else 'cls')
-        elif cmd == 'menu':
-            self._cmd_interactive_menu()
-        elif cmd == 'live-search':
-            self._cmd_live_search()
-        elif cmd == 'status':
-            self._cmd_show_status()
-        elif cmd == 'interactive':
-            self._cmd_toggle_interactive()
-        elif cmd == 'new':
-            self._cmd_new(args)
-        elif cmd == 'edit' or cmd == 'open':
-            self._cmd_edit(args)
-        elif cmd == 'show':
-            self._cmd_show(args)
-        elif cmd == 'delete':
-            self._cmd_delete(args)
-        elif cmd == 'list':
-            self._cmd_list()
-        elif cmd == 'search':
-            self._cmd_search(args)
-        elif cmd == 'link':
-            self._cmd_link(args)
-        elif cmd == 'backlinks':
-            self._cmd_backlinks(args)
-        elif cmd == 'theme':
-            self._cmd_theme(args)
-        elif cmd == 'editor':
-            self._cmd_editor(args)
-        elif cmd == 'user':
-            self._cmd_user(args)
+        cmd, _, args = command.partition(' ')
+        cmd = cmd.lower()
+        if args:
+            args = args.lstrip()
+        
+        handler = self._nullary.get(cmd)
+        if handler is not None:
+            handler()
+            return
+        handler = self._unary.get(cmd)
+        if handler is not None:
+            handler(args)
         else:
-            # Try to show note if it's a note title
-            if self.note_manager.exists(command):
+            # Try to show note if it's a note title. A miss only goes to disk
+            # when the notes directory changed since the set was loaded
+            name = self.note_manager._get_note_path(command).name
+            if name in self._note_files or (self._load_note_files() and name in self._note_files):
                 self._cmd_show(command)
             else:
                 self.console.print(f"[red]Unknown command: {cmd}[/red]")
                 self.console.print("[dim]Type 'help' for available commands[/dim]")
     
+    def _cmd_quit(self):
+        """Leave the REPL loop."""
+        self.running = False
+    
+    def _cmd_clear(self):
+        """Clear the screen."""
+        self.console.clear()
+    
     def _cmd_help(self):
         """Show help message."""
-        notes_path = self.config.notes_dir
-        help_text = f"""
-[bold cyan]Commands:[/bold cyan]
-
-  [cyan]new <title>[/cyan]          Create a new note
-  [cyan]edit <title>[/cyan]         Open note in editor
-  [cyan]open <title>[/cyan]         Alias for edit
-  [cyan]show <title>[/cyan]         Display note content
-  [cyan]delete <title>[/cyan]       Delete a note
-  [cyan]list[/cyan]                 List all notes
-  [cyan]search <query>[/cyan]       Search notes by content
-  [cyan]link <title>[/cyan]         Show links in a note
-  [cyan]backlinks <title>[/cyan]    Show backlinks to a note
-  [cyan]theme <name>[/cyan]         Change theme (default, dark, nord, cyan, brown, grey)
-  [cyan]editor [name][/cyan]        Show or set editor (nano, vim, etc.)
-  [cyan]user [name][/cyan]          Show or set user name
-  [cyan]clear[/cyan]                Clear screen
-  [cyan]help[/cyan]                 Show this help
-  [cyan]quit[/cyan]                 Exit Anada
-
-[bold green]Interactive Features:[/bold green]
-
-  [green]menu[/green]                   Interactive command menu
-  [green]live-search[/green]            Real-time search with preview
-  [green]status[/green]                Show live statistics
-  [green]interactive[/green]           Toggle interactive mode
-
-[dim]Tip: Type a note title directly to view it[/dim]
-
-[dim]Notes are saved to: {notes_path}[/dim]
-[dim]All notes persist across terminal sessions![/dim]
-"""
-        self.console.print(help_text)
+        self.console.print(self._help_renderable)
     
     def _cmd_new(self, title: str):
         """Create a new note."""
@@ -200,6 +344,7 @@ class REPL:
         
         try:
             path = self.note_manager.create(title)
+            self._note_added(path)
             self.console.print(f"[green]Created: {path.name}[/green]")
             self.console.print(f"[dim]Saved to: {path}[/dim]")
             # Ask if user wants to edit
@@ -213,12 +358,11 @@ class REPL:
             self.console.print("[red]Usage: edit <title>[/red]")
             return
         
-        if not self.note_manager.exists(title):
-            # Create if doesn't exist
-            self.note_manager.create(title)
-        
-        path = self.note_manager._get_note_path(title)
-        editor = self.config.editor
+        # Create if doesn't exist
+        path, existed = self.note_manager.get_or_create_path(title)
+        if not existed:
+            self._note_added(path)
+        editor = self._editor
         
         # Show which editor is being used
         self.console.print(f"[dim]Opening in editor: [cyan]{editor}[/cyan][/dim]")
@@ -229,13 +373,18 @@ class REPL:
         
         # Open in editor
         try:
-            subprocess.run([editor, str(path)], check=True)
-            # After editor closes, note is saved by the editor
-            self.console.print(f"[green]Note saved to: {path}[/green]")
-        except subprocess.CalledProcessError:
-            self.console.print(f"[red]Failed to open editor: {editor}[/red]")
+            # CPython only uses posix_spawn() instead of fork()+exec() for an
+            # executable path with a directory part and close_fds=False; the
+            # REPL holds no descriptors the editor must not see
+            returncode = subprocess.call([_which_cached(editor) or editor, str(path)], close_fds=False)
         except FileNotFoundError:
             self.console.print(f"[red]Editor not found: {editor}[/red]")
+            return
+        if returncode != 0:
+            self.console.print(f"[red]Failed to open editor: {editor}[/red]")
+            return
+        # After editor closes, note is saved by the editor
+        self.console.print(f"[green]Note saved to: {path}[/green]")
     
     def _cmd_show(self, title: str):
         """Show a note."""
@@ -269,9 +418,14 @@ class REPL:
             return
         
         # Confirm
-        confirm = self.session.prompt(f"Delete '{title}'? [y/N]: ")
+        message = f"Delete '{title}'? [y/N]: "
+        if self._yes_no_session is None:
+            confirm = input(message)
+        else:
+            confirm = self._yes_no_session.prompt(message)
         if confirm.lower() == 'y':
-            self.note_manager.delete(title)
+            if self.note_manager.delete(title):
+                self._note_removed(self.note_manager._get_note_path(title))
             self.console.print(f"[green]Deleted: {title}[/green]")
         else:
             self.console.print("[dim]Cancelled[/dim]")
@@ -308,9 +462,8 @@ class REPL:
         links = self.note_manager.find_links(content)
         if links:
             self.console.print(f"\n[bold cyan]Links in '{title}':[/bold cyan]\n")
-            for link in links:
-                # Use print() to avoid Rich markup interpretation
-                print(f"  [[{link}]]")
+            # Use print() to avoid Rich markup interpretation; one write for all lines
+            print('\n'.join(f"  [[{link}]]" for link in links))
         else:
             self.console.print(f"[dim]No links found in '{title}'[/dim]")
     
@@ -323,9 +476,8 @@ class REPL:
         backlinks = self.note_manager.get_backlinks(title)
         if backlinks:
             self.console.print(f"\n[bold cyan]Backlinks to '{title}':[/bold cyan]\n")
-            for link in backlinks:
-                # Use print() to avoid Rich markup interpretation
-                print(f"  [[{link}]]")
+            # Use print() to avoid Rich markup interpretation; one write for all lines
+            print('\n'.join(f"  [[{link}]]" for link in backlinks))
         else:
             self.console.print(f"[dim]No backlinks found for '{title}'[/dim]")
     
@@ -336,13 +488,9 @@ class REPL:
             self.console.print("[dim]Available themes: default, dark, nord, cyan, brown, grey[/dim]")
             return
         
-        themes = self.config.get('themes', {})
-        if theme_name in themes:
+        if theme_name in self._theme_names:
             self.config.set('theme', theme_name)
-            self.renderer = MarkdownRenderer(
-                self.config.get_theme_colors(),
-                self.console
-            )
+            self.renderer.set_theme(self.config.get_theme_colors())
             self.console.print(f"[green]Theme changed to: {theme_name}[/green]")
         else:
             self.console.print(f"[red]Unknown theme: {theme_name}[/red]")
@@ -352,7 +500,7 @@ class REPL:
         """Show or set the editor."""
         if not editor_name:
             # Show current editor
-            current_editor = self.config.editor
+            current_editor = self._editor
             self.console.print(f"\n[bold cyan]Current Editor:[/bold cyan] [yellow]{current_editor}[/yellow]")
             
             # Check if it's vim or nano and show helpful tips
@@ -376,9 +524,9 @@ class REPL:
         else:
             # Set new editor
             # Check if editor exists
-            import shutil
-            if shutil.which(editor_name):
+            if _which_cached(editor_name):
                 self.config.set('editor', editor_name)
+                self._editor = editor_name
                 self.console.print(f"[green]Editor changed to: {editor_name}[/green]")
                 
                 # Show helpful tips for the new editor
@@ -406,20 +554,11 @@ class REPL:
             self.console.print(f"[green]User name set to: {user_name}[/green]")
             self.console.print("[dim]You'll see a personalized welcome message next time![/dim]")
     
-    def _update_status_info(self):
-        """Update status information."""
-        notes = self.note_manager.list_all()
-        self.status_info['total_notes'] = len(notes)
-        if notes:
-            latest = max(notes, key=lambda x: x['modified'])
-            self.status_info['last_modified'] = latest['modified'].strftime('%Y-%m-%d %H:%M')
-        else:
-            self.status_info['last_modified'] = 'Never'
-        self.status_info['current_theme'] = self.config.theme
-    
     def _cmd_interactive_menu(self):
         """Show interactive command menu."""
         try:
+            from prompt_toolkit.shortcuts import radiolist_dialog, input_dialog
+            
             # Create menu options
             choices = [
                 ('new', 'Create a new note'),
@@ -469,6 +608,8 @@ class REPL:
     def _show_theme_menu(self):
         """Show theme selection menu."""
         try:
+            from prompt_toolkit.shortcuts import radiolist_dialog
+            
             themes = list(self.config.get('themes', {}).keys())
             choices = [(theme, f"Switch to {theme} theme") for theme in themes]
             
@@ -487,6 +628,8 @@ class REPL:
     def _show_editor_menu(self):
         """Show editor selection menu."""
         try:
+            from prompt_toolkit.shortcuts import radiolist_dialog
+            
             editors = [
                 ('nano', 'Nano - Simple and beginner-friendly'),
                 ('vim', 'Vim - Powerful text editor'),
@@ -497,7 +640,7 @@ class REPL:
             
             result = radiolist_dialog(
                 title="Select Editor",
-                text=f"Current editor: {self.config.editor}",
+                text=f"Current editor: {self._editor}",
                 values=editors
             ).run()
             
@@ -512,21 +655,23 @@ class REPL:
         self.console.print("[bold cyan]🔍 Live Search Mode[/bold cyan]")
         self.console.print("[dim]Type to search, press Enter to view note, Ctrl+C to exit[/dim]\n")
         
+        # Notes may have changed since the last live search
+        self._search_cache.clear()
+        
         try:
             query = ""
             while True:
                 try:
                     if query:
                         # Show search prompt with current query
-                        user_input = self.session.prompt(f"search ({query})> ")
+                        user_input = self._prompt(f"search ({query})> ")
                     else:
-                        user_input = self.session.prompt("search> ")
+                        user_input = self._prompt("search> ")
                     
                     if not user_input.strip():
                         if query:
                             # Show current results
-                            results = self.note_manager.search(query)
-                            self._show_live_preview(results, query)
+                            self._run_live_search(query)
                         continue
                     
                     # Check if it's a command to select a note
@@ -542,14 +687,13 @@ class REPL:
                         break
                     elif user_input == 'clear':
                         query = ""
-                        os.system('clear' if os.name != 'nt' else 'cls')
+                        self.console.clear()
                         self.console.print("[bold cyan]🔍 Live Search Mode[/bold cyan]")
                         continue
                     
                     # Update search query
                     query = user_input
-                    results = self.note_manager.search(query)
-                    self._show_live_preview(results, query)
+                    self._run_live_search(query)
                     
                 except KeyboardInterrupt:
                     break
@@ -559,6 +703,39 @@ class REPL:
         
         self.console.print("\n[dim]Exited live search mode[/dim]")
     
+    def _run_live_search(self, query: str):
+        """Run a live search and show it, going back to the prompt on Ctrl+C."""
+        try:
+            results = self._live_search(query)
+        except KeyboardInterrupt:
+            # Drop the slow search instead of leaving live search; a search
+            # interrupted before it finished is never cached
+            self.console.print("\n[dim]Search cancelled[/dim]")
+            return
+        self._show_live_preview(results, query)
+    
+    def _live_search(self, query: str) -> list:
+        """Search for live-search, reusing cached results for earlier prefixes of the query."""
+        key = query.lower()
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            self._search_cache.move_to_end(key)
+            return cached
+        
+        # Every note matching the query also matches any prefix of it, so the
+        # longest cached prefix bounds which notes need to be rescanned
+        prefix = max((k for k in self._search_cache if key.startswith(k)), key=len, default=None)
+        if prefix is not None:
+            paths = [result['path'] for result in self._search_cache[prefix]]
+            results = self.note_manager.search(query, paths=paths)
+        else:
+            results = self.note_manager.search(query)
+        
+        self._search_cache[key] = results
+        if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+        return results
+    
     def _show_live_preview(self, results, query):
         """Show live search results with preview."""
         if not results:
@@ -571,10 +748,17 @@ class REPL:
         table.add_column("Preview", style="dim", width=50)
         table.add_column("Matches", justify="center", style="green", width=8)
         
-        for i, result in enumerate(results[:5]):  # Show top 5 results
-            preview = result['snippet'][:80] + '...' if len(result['snippet']) > 80 else result['snippet']
-            # Highlight the query in preview
-            preview = preview.replace(query, f"[bold yellow]{query}[/bold yellow]")
+        # Case-insensitive highlighter, compiled once for all rows
+        highlight = re.compile(re.escape(query), re.IGNORECASE)
+        
+        for result in results[:5]:  # Show top 5 results
+            snippet = result['snippet']
+            # Truncate first so only the visible part is scanned; Text keeps
+            # '[' in note content from being read as markup
+            preview = Text(snippet[:80])
+            preview.highlight_regex(highlight, "bold yellow")
+            if len(snippet) > 80:
+                preview.append('...')
             table.add_row(
                 result['title'][:25] + '...' if len(result['title']) > 25 else result['title'],
                 preview,
@@ -589,10 +773,14 @@ class REPL:
     
     def _cmd_show_status(self):
         """Show live status information."""
-        self._update_status_info()
-        
-        # Create status panel
-        layout = Layout()
+        # Count, newest modification and recent notes all come from one directory scan
+        total, notes = self.note_manager.status(5)
+        self.status_info['total_notes'] = total
+        if notes:
+            self.status_info['last_modified'] = notes[0]['modified'].strftime('%Y-%m-%d %H:%M')
+        else:
+            self.status_info['last_modified'] = 'Never'
+        self.status_info['current_theme'] = self.config.theme
         
         # Status table
         status_table = Table(box=box.ROUNDED, show_header=False, title="Anada Status")
@@ -602,17 +790,16 @@ class REPL:
         status_table.add_row("Total Notes", str(self.status_info['total_notes']))
         status_table.add_row("Last Modified", self.status_info['last_modified'])
         status_table.add_row("Current Theme", self.status_info['current_theme'])
-        status_table.add_row("Editor", self.config.editor)
+        status_table.add_row("Editor", self._editor)
         status_table.add_row("Notes Directory", str(self.config.notes_dir))
         
         # Recent notes table
-        notes = self.note_manager.list_all()
         recent_table = Table(box=box.ROUNDED, show_header=True, title="Recent Notes")
         recent_table.add_column("Note", style="cyan", width=25)
         recent_table.add_column("Modified", style="dim", width=20)
         recent_table.add_column("Size", style="dim", width=10)
         
-        for note in notes[:5]:  # Show 5 most recent
+        for note in notes:  # Show 5 most recent
             recent_table.add_row(
                 note['title'][:22] + '...' if len(note['title']) > 22 else note['title'],
                 note['modified'].strftime('%m-%d %H:%M'),
@@ -635,9 +822,4 @@ class REPL:
             self.console.print("[dim]Enhanced features are now active. Try 'menu', 'live-search', or 'status'[/dim]")
         else:
             self.console.print("[dim]Interactive mode disabled[/dim]")
-    
-    def _cmd_live_search(self):
-        """Interactive live search with note preview."""
-        self.console.print("[bold cyan]Live Search Mode[/bold cyan]")
-        self.console.print("[dim]Type to search, press Enter to view note, Ctrl+C to exit[/dim]\n")
 